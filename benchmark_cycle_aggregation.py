@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""
+Benchmark cycle totals: Python sum over DailyUsage documents vs one aggregation
+Creates a temporary user with 60, 365 and 3650 days of usage and removes it afterwards
+"""
+import os
+import sys
+import time
+import django
+from datetime import datetime, timedelta
+
+# Add the project directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'eb_calculator.settings')
+django.setup()
+
+from bills.models import User, DailyUsage, Appliance
+from usage_aggregation import aggregate_cycle_usage
+
+BENCHMARK_USERNAME = 'benchmark_cycle_user'
+HISTORY_DAYS = [60, 365, 3650]
+RUNS = 5
+
+APPLIANCES = [
+    ('Fan', 8.5),
+    ('Light', 5.2),
+    ('TV', 4.8),
+    ('Refrigerator', 12.0),
+]
+
+def create_history(user, days):
+    """Insert `days` daily records ending today in a single bulk insert"""
+    DailyUsage.objects.filter(user=user).delete()
+    today = datetime.combine(datetime.now().date(), datetime.min.time())
+    records = []
+    for i in range(days):
+        appliances = [Appliance(name=name, units_consumed=units) for name, units in APPLIANCES]
+        records.append(DailyUsage(
+            user=user,
+            date=today - timedelta(days=i),
+            appliances=appliances,
+            total_units=sum(units for _, units in APPLIANCES)
+        ))
+    DailyUsage.objects.insert(records, load_bulk=False)
+
+def python_sum(user):
+    """The previous approach: hydrate every document and add up total_units"""
+    usage_records = DailyUsage.objects.filter(user=user)
+    return len(usage_records), sum(record.total_units for record in usage_records)
+
+def server_aggregate(user):
+    cycle = aggregate_cycle_usage(DailyUsage.objects.filter(user=user))
+    return cycle['record_count'], cycle['total_units']
+
+def best_of(func, user):
+    """Return (best time in ms, result) over RUNS calls"""
+    timings = []
+    result = None
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        result = func(user)
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings), result
+
+def main():
+    print("⏱️ Cycle Total Benchmark: Python sum vs MongoDB aggregation")
+    print("=" * 60)
+
+    user = User.objects.filter(username=BENCHMARK_USERNAME).first()
+    if not user:
+        user = User(
+            username=BENCHMARK_USERNAME,
+            full_name='Benchmark User',
+            email='benchmark@example.com'
+        )
+        user.set_password('benchmark123')
+        user.save()
+
+    try:
+        print(f"{'Days':>6} {'Python sum (ms)':>16} {'Aggregate (ms)':>15} {'Speedup':>8}")
+        for days in HISTORY_DAYS:
+            create_history(user, days)
+
+            python_ms, python_result = best_of(python_sum, user)
+            aggregate_ms, aggregate_result = best_of(server_aggregate, user)
+
+            if python_result[0] != aggregate_result[0] or abs(python_result[1] - aggregate_result[1]) > 1e-6:
+                print(f"❌ Results differ for {days} days: {python_result} vs {aggregate_result}")
+                return False
+
+            speedup = python_ms / aggregate_ms if aggregate_ms else float('inf')
+            print(f"{days:>6} {python_ms:>16.2f} {aggregate_ms:>15.2f} {speedup:>7.1f}x")
+    finally:
+        DailyUsage.objects.filter(user=user).delete()
+        user.delete()
+        print("🧹 Benchmark data removed")
+
+    return True
+
+if __name__ == '__main__':
+    success = main()
+    if not success:
+        sys.exit(1)
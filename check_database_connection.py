@@ -19,11 +19,11 @@ def check_current_database():
     print("🔍 Checking Current Database Connection...")
     
     try:
-        import pymongo
+        from mongodb_connection import get_client
         from bills.models import User, DailyUsage
         
         # Check direct MongoDB connection
-        client = pymongo.MongoClient('localhost', 27017)
+        client = get_client()
         databases = client.list_database_names()
         print(f"📊 Available MongoDB databases: {databases}")
         
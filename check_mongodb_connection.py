@@ -13,12 +13,11 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 def check_mongodb_service():
     """Check if MongoDB service is running"""
     try:
-        import pymongo
-        client = pymongo.MongoClient('localhost', 27017, serverSelectionTimeoutMS=2000)
-        # Force connection
-        client.server_info()
-        print("✓ MongoDB service is running on localhost:27017")
-        return True, client
+        from mongodb_connection import check_server, get_client, server_address
+        # Short probe so a stopped server fails fast
+        check_server(timeout_ms=2000)
+        print(f"✓ MongoDB service is running on {server_address()}")
+        return True, get_client()
     except Exception as e:
         print(f"✗ MongoDB service check failed: {e}")
         print("\nTo start MongoDB:")
@@ -30,13 +29,12 @@ def check_mongodb_service():
 def check_database_connection():
     """Check database connection and collections"""
     try:
-        import pymongo
-        client = pymongo.MongoClient('localhost', 27017)
-        db = client['eb_calculator_db']
+        from mongodb_connection import get_database
+        db = get_database()
         
         # List collections
         collections = db.list_collection_names()
-        print(f"✓ Connected to database 'eb_calculator_db'")
+        print(f"✓ Connected to database '{db.name}'")
         print(f"  Collections found: {collections if collections else 'None (new database)'}")
         
         # Test write operation
@@ -87,9 +85,8 @@ def check_django_mongoengine():
 def show_database_stats():
     """Show database statistics"""
     try:
-        import pymongo
-        client = pymongo.MongoClient('localhost', 27017)
-        db = client['eb_calculator_db']
+        from mongodb_connection import ANALYTICAL, get_database
+        db = get_database(route=ANALYTICAL)
         
         print("\n📊 Database Statistics:")
         print("=" * 50)
@@ -142,7 +139,14 @@ def main():
         print("\n❌ Django integration failed.")
         return False
     
-    # Step 4: Show database stats
+    # Step 4: Check required indexes (read-only)
+    print("\n4. Checking required indexes...")
+    from init_mongodb_database import verify_required_indexes
+    if not verify_required_indexes():
+        print("\n❌ Required indexes are missing. Run: python init_mongodb_database.py")
+        return False
+    
+    # Step 5: Show database stats
     show_database_stats()
     
     print("\n✅ All checks passed! Your MongoDB connection is ready.")
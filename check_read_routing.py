@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""
+Check that analytical reads go to a secondary and transactional reads to the primary
+Needs a replica set with at least one secondary (see MONGODB_SETUP_GUIDE.md)
+"""
+import os
+import sys
+
+# Add the project directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from mongodb_connection import (
+    ANALYTICAL, TRANSACTIONAL, check_server, get_database, pool_stats, server_address
+)
+
+def answering_member(route):
+    """Run `hello` with the route's read preference and return the member's reply"""
+    db = get_database(route=route)
+    return db.command('hello', read_preference=db.client.read_preference)
+
+def main():
+    print("🔀 Read-Preference Routing Check")
+    print("=" * 50)
+
+    try:
+        server_info = check_server(timeout_ms=3000)
+        print(f"✅ MongoDB {server_info.get('version', 'Unknown')} running on {server_address()}")
+    except Exception as e:
+        print(f"❌ MongoDB is not reachable on {server_address()}: {e}")
+        return False
+
+    transactional = answering_member(TRANSACTIONAL)
+    if 'setName' not in transactional:
+        print("❌ Server is not a replica set member; routing cannot be checked")
+        print("   Start a local replica set as described in MONGODB_SETUP_GUIDE.md")
+        return False
+    print(f"✅ Replica set '{transactional['setName']}' with hosts: {transactional.get('hosts', [])}")
+
+    analytical = answering_member(ANALYTICAL)
+    print(f"   Transactional read answered by: {transactional['me']} "
+          f"({'primary' if transactional.get('isWritablePrimary') else 'secondary'})")
+    print(f"   Analytical read answered by: {analytical['me']} "
+          f"({'secondary' if analytical.get('secondary') else 'primary'})")
+
+    print(f"   Pool wait stats: {pool_stats()}")
+
+    ok = transactional.get('isWritablePrimary') and analytical.get('secondary')
+    print("\n" + ("✅ Routing works: analytics read from a secondary"
+                  if ok else "❌ Routing failed: analytics did not reach a secondary"))
+    return bool(ok)
+
+if __name__ == '__main__':
+    success = main()
+    if not success:
+        sys.exit(1)
@@ -15,8 +15,17 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'eb_calculator.settings')
 import django
 django.setup()
 
+from pymongo.errors import OperationFailure
+
 from bills.models import User, DailyUsage, Appliance, BillCalculation
 
+# Compound indexes for the hot queries: usage by user and date range,
+# bills by user and billing period
+REQUIRED_INDEXES = [
+    (DailyUsage, [('user', 1), ('date', 1)]),
+    (BillCalculation, [('user', 1), ('billing_period_start', 1), ('billing_period_end', 1)]),
+]
+
 def create_database_indexes():
     """Create database indexes for better performance"""
     try:
@@ -34,11 +43,42 @@ def create_database_indexes():
         BillCalculation.ensure_indexes()
         print("✓ BillCalculation indexes created")
         
-        return True
+        # Compound indexes for user + date range lookups
+        for model, keys in REQUIRED_INDEXES:
+            collection = model._get_collection()
+            try:
+                collection.create_index(keys)
+            except OperationFailure as e:
+                # 85/86: an index on these keys exists under another name or options
+                if e.code not in (85, 86):
+                    raise
+                print(f"⚠ Existing index on {collection.name} {keys} conflicts: {e.details.get('errmsg', e)}")
+                print("  Keeping the existing index; drop it and re-run to recreate it with default options")
+        print("✓ Compound query indexes created")
+        
+        return verify_required_indexes()
     except Exception as e:
         print(f"✗ Error creating indexes: {e}")
         return False
 
+def verify_required_indexes():
+    """Check that every index in REQUIRED_INDEXES exists (read-only, creates nothing)"""
+    missing = []
+    for model, keys in REQUIRED_INDEXES:
+        collection = model._get_collection()
+        existing = [info['key'] for info in collection.index_information().values()]
+        if keys not in existing:
+            missing.append(f"{collection.name} {keys}")
+    
+    if missing:
+        print("✗ Missing required indexes:")
+        for index in missing:
+            print(f"  - {index}")
+        return False
+    
+    print("✓ All required indexes present")
+    return True
+
 def create_admin_user():
     """Create an admin user for the system"""
     try:
@@ -177,18 +217,40 @@ def show_database_summary():
         print(f"Daily Usage Records: {usage_count}")
         print(f"Bill Calculations: {bill_count}")
         
+        # Per-user counts and date ranges in one $group pass each,
+        # instead of a count query per user
+        usage_stats = {
+            row['_id']: row for row in DailyUsage._get_collection().aggregate([
+                {'$group': {
+                    '_id': '$user',
+                    'count': {'$sum': 1},
+                    'first_date': {'$min': '$date'},
+                    'last_date': {'$max': '$date'},
+                }}
+            ])
+        }
+        bill_counts = {
+            row['_id']: row['count'] for row in BillCalculation._get_collection().aggregate([
+                {'$group': {'_id': '$user', 'count': {'$sum': 1}}}
+            ])
+        }
+        
         if user_count > 0:
             print("\nUsers in database:")
-            for user in User.objects.all():
-                usage_records = DailyUsage.objects.filter(user=user).count()
-                print(f"  - {user.username} ({user.full_name}) - {usage_records} usage records")
+            for user in User.objects.only('id', 'username', 'full_name'):
+                stats = usage_stats.get(user.id, {})
+                usage_records = stats.get('count', 0)
+                bills = bill_counts.get(user.id, 0)
+                print(f"  - {user.username} ({user.full_name}) - {usage_records} usage records, {bills} bills")
+                if usage_records:
+                    print(f"      {stats['first_date'].strftime('%Y-%m-%d')} to {stats['last_date'].strftime('%Y-%m-%d')}")
         
-        if usage_count > 0:
-            latest_usage = DailyUsage.objects.order_by('-date').first()
-            oldest_usage = DailyUsage.objects.order_by('date').first()
+        if usage_stats:
+            oldest = min(row['first_date'] for row in usage_stats.values())
+            latest = max(row['last_date'] for row in usage_stats.values())
             print(f"\nUsage data range:")
-            print(f"  From: {oldest_usage.date.strftime('%Y-%m-%d')}")
-            print(f"  To: {latest_usage.date.strftime('%Y-%m-%d')}")
+            print(f"  From: {oldest.strftime('%Y-%m-%d')}")
+            print(f"  To: {latest.strftime('%Y-%m-%d')}")
         
     except Exception as e:
         print(f"Error getting database summary: {e}")
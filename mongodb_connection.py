@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+"""
+Shared MongoDB connection for the EB Calculator scripts
+One pooled client per process and route, configured from environment variables
+"""
+import os
+import sys
+import threading
+import time
+
+import pymongo
+from pymongo import monitoring
+from pymongo.read_preferences import make_read_preference, read_pref_mode_from_name
+
+MONGODB_DB = os.environ.get('MONGODB_DB', 'eb_calculator_db')
+MONGODB_HOST = os.environ.get('MONGODB_HOST', 'localhost')
+MONGODB_PORT = int(os.environ.get('MONGODB_PORT', 27017))
+
+# Pool and timeout settings (milliseconds)
+MONGODB_MAX_POOL_SIZE = int(os.environ.get('MONGODB_MAX_POOL_SIZE', 50))
+MONGODB_MIN_POOL_SIZE = int(os.environ.get('MONGODB_MIN_POOL_SIZE', 0))
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = int(os.environ.get('MONGODB_WAIT_QUEUE_TIMEOUT_MS', 10000))
+MONGODB_SERVER_SELECTION_TIMEOUT_MS = int(os.environ.get('MONGODB_SERVER_SELECTION_TIMEOUT_MS', 5000))
+MONGODB_CONNECT_TIMEOUT_MS = int(os.environ.get('MONGODB_CONNECT_TIMEOUT_MS', 10000))
+MONGODB_SOCKET_TIMEOUT_MS = int(os.environ.get('MONGODB_SOCKET_TIMEOUT_MS', 30000))
+MONGODB_READ_PREFERENCE = os.environ.get('MONGODB_READ_PREFERENCE', 'primary')
+MONGODB_REPLICA_SET = os.environ.get('MONGODB_REPLICA_SET', '')
+
+# Analytical reads (reports, summaries) may go to a secondary that lags the
+# primary by at most this many seconds (MongoDB requires at least 90)
+MONGODB_ANALYTICS_READ_PREFERENCE = os.environ.get('MONGODB_ANALYTICS_READ_PREFERENCE', 'secondaryPreferred')
+MONGODB_ANALYTICS_MAX_STALENESS_S = int(os.environ.get('MONGODB_ANALYTICS_MAX_STALENESS_S', 90))
+
+TRANSACTIONAL = 'transactional'
+ANALYTICAL = 'analytical'
+
+
+class PoolWaitMonitor(monitoring.ConnectionPoolListener):
+    """Record how long threads wait to check a connection out of the pool"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = {}
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._started.clear()
+            self.checkouts = 0
+            self.failed_checkouts = 0
+            self.total_wait_ms = 0.0
+            self.max_wait_ms = 0.0
+
+    def connection_check_out_started(self, event):
+        self._started[threading.get_ident()] = time.monotonic()
+
+    def connection_checked_out(self, event):
+        self._finish_wait(failed=False)
+
+    def connection_check_out_failed(self, event):
+        self._finish_wait(failed=True)
+
+    def _finish_wait(self, failed):
+        started = self._started.pop(threading.get_ident(), None)
+        if started is None:
+            return
+        wait_ms = (time.monotonic() - started) * 1000
+        with self._lock:
+            if failed:
+                self.failed_checkouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def stats(self):
+        with self._lock:
+            attempts = self.checkouts + self.failed_checkouts
+            return {
+                'checkouts': self.checkouts,
+                'failed_checkouts': self.failed_checkouts,
+                'total_wait_ms': round(self.total_wait_ms, 3),
+                'avg_wait_ms': round(self.total_wait_ms / attempts, 3) if attempts else 0.0,
+                'max_wait_ms': round(self.max_wait_ms, 3),
+            }
+
+    # Remaining pool events are not needed for wait-time metrics
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        pass
+
+    def connection_checked_in(self, event):
+        pass
+
+
+# One monitor per route so primary and secondary pool waits stay separate
+pool_monitors = {TRANSACTIONAL: PoolWaitMonitor(), ANALYTICAL: PoolWaitMonitor()}
+
+
+def pool_stats():
+    """Pool wait-time metrics keyed by query route"""
+    return {route: monitor.stats() for route, monitor in pool_monitors.items()}
+
+_clients = {}
+_client_pid = None
+_client_lock = threading.Lock()
+
+
+def read_preference(mode, max_staleness=-1):
+    """Build a pymongo read preference object from a mode name like 'secondaryPreferred'
+
+    mongoengine only honours an object passed as read_preference=; a
+    'readPreference' string is overridden by its own Primary() default.
+    """
+    try:
+        mode_id = read_pref_mode_from_name(mode)
+    except ValueError:
+        raise ValueError(f"Unknown read preference: {mode}") from None
+    if mode == 'primary':
+        return make_read_preference(mode_id, None)
+    return make_read_preference(mode_id, None, max_staleness)
+
+
+def client_options(route=TRANSACTIONAL):
+    """Keyword arguments shared by pymongo and mongoengine connections"""
+    if route not in (TRANSACTIONAL, ANALYTICAL):
+        raise ValueError(f"Unknown query route: {route}")
+    options = {
+        'maxPoolSize': MONGODB_MAX_POOL_SIZE,
+        'minPoolSize': MONGODB_MIN_POOL_SIZE,
+        'waitQueueTimeoutMS': MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        'serverSelectionTimeoutMS': MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        'connectTimeoutMS': MONGODB_CONNECT_TIMEOUT_MS,
+        'socketTimeoutMS': MONGODB_SOCKET_TIMEOUT_MS,
+        'read_preference': read_preference(MONGODB_READ_PREFERENCE),
+        'event_listeners': [pool_monitors[route]],
+    }
+    if MONGODB_REPLICA_SET:
+        options['replicaSet'] = MONGODB_REPLICA_SET
+    if route == ANALYTICAL:
+        options['read_preference'] = read_preference(
+            MONGODB_ANALYTICS_READ_PREFERENCE, MONGODB_ANALYTICS_MAX_STALENESS_S
+        )
+    return options
+
+
+def get_client(route=TRANSACTIONAL):
+    """Return this process's MongoClient for a query route, creating it on first use
+
+    Transactional queries (writes, read-your-writes) use the primary.
+    Analytical queries use a separate client that may read from a secondary.
+    A client inherited across fork() is never reused; the child builds its own.
+    """
+    global _clients, _client_pid
+    pid = os.getpid()
+    client = _clients.get(route) if _client_pid == pid else None
+    if client is None:
+        with _client_lock:
+            if _client_pid != pid:
+                _clients = {}
+                _client_pid = pid
+            client = _clients.get(route)
+            if client is None:
+                client = pymongo.MongoClient(MONGODB_HOST, MONGODB_PORT, **client_options(route))
+                _clients[route] = client
+    return client
+
+
+def get_analytics_client():
+    """Shortcut for get_client(ANALYTICAL)"""
+    return get_client(ANALYTICAL)
+
+
+def get_database(name=None, route=TRANSACTIONAL):
+    """Return a database handle from the shared client"""
+    return get_client(route)[name or MONGODB_DB]
+
+
+def check_server(timeout_ms=2000):
+    """Liveness probe on a throwaway client, so a down server fails fast
+
+    Returns the server_info() document; raises if MongoDB is unreachable.
+    """
+    client = pymongo.MongoClient(
+        MONGODB_HOST,
+        MONGODB_PORT,
+        serverSelectionTimeoutMS=timeout_ms,
+        connectTimeoutMS=timeout_ms,
+    )
+    try:
+        return client.server_info()
+    finally:
+        client.close()
+
+
+def server_address():
+    """Configured host:port, for status messages"""
+    return f"{MONGODB_HOST}:{MONGODB_PORT}"
+
+
+def connect_mongoengine(db=None, alias='default', route=TRANSACTIONAL):
+    """Register a mongoengine connection with the same pool settings"""
+    from mongoengine import connect
+    return connect(db or MONGODB_DB, alias=alias, host=MONGODB_HOST, port=MONGODB_PORT, **client_options(route))
+
+
+def _drop_mongoengine_connections():
+    """Forget every mongoengine client but keep the registered settings
+
+    Covers all aliases, including 'default' registered by the Django
+    settings module. get_connection() then rebuilds them lazily. The
+    inherited clients are not closed, since their sockets still belong
+    to the parent.
+    """
+    if 'mongoengine' not in sys.modules:
+        return
+    from mongoengine import Document
+    from mongoengine import connection as me_connection
+    from mongoengine.base.common import _get_documents_by_db
+    aliases = set(me_connection._connections) | set(me_connection._dbs)
+    me_connection._connections.clear()
+    me_connection._dbs.clear()
+    for alias in aliases:
+        # Documents cache their collection, which holds the old client
+        for doc_cls in _get_documents_by_db(alias, me_connection.DEFAULT_CONNECTION_NAME):
+            if issubclass(doc_cls, Document):
+                doc_cls._disconnect()
+
+
+def close_client():
+    """Close the shared clients (e.g. at the end of a worker)"""
+    global _clients, _client_pid
+    with _client_lock:
+        if _client_pid == os.getpid():
+            for client in _clients.values():
+                client.close()
+        _clients = {}
+        _client_pid = None
+
+
+def _reset_after_fork():
+    # The parent's sockets must not be used from the child
+    global _clients, _client_pid, _client_lock
+    _clients = {}
+    _client_pid = None
+    _client_lock = threading.Lock()
+    for monitor in pool_monitors.values():
+        monitor._lock = threading.Lock()
+        monitor.reset()
+    _drop_mongoengine_connections()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
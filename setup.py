@@ -22,15 +22,16 @@ def run_command(command, description):
 
 def check_mongodb():
     """Check if MongoDB is running"""
+    address = 'localhost:27017'
     try:
-        import pymongo
-        client = pymongo.MongoClient('localhost', 27017, serverSelectionTimeoutMS=2000)
-        client.server_info()
+        from mongodb_connection import check_server, server_address
+        address = server_address()
+        check_server(timeout_ms=2000)
         print("✓ MongoDB is running and accessible")
         return True
     except Exception as e:
         print(f"✗ MongoDB connection failed: {e}")
-        print("Please make sure MongoDB is installed and running on localhost:27017")
+        print(f"Please make sure MongoDB is installed and running on {address}")
         return False
 
 
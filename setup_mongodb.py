@@ -14,10 +14,9 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 def check_mongodb_connection():
     """Check if MongoDB is running and accessible"""
     try:
-        import pymongo
-        client = pymongo.MongoClient('localhost', 27017, serverSelectionTimeoutMS=3000)
-        client.server_info()  # Force connection
-        print("✓ MongoDB is running on localhost:27017")
+        from mongodb_connection import check_server, server_address
+        check_server(timeout_ms=3000)  # Short probe so a stopped server fails fast
+        print(f"✓ MongoDB is running on {server_address()}")
         return True
     except Exception as e:
         print(f"✗ MongoDB connection failed: {e}")
@@ -127,8 +126,8 @@ def main():
     # Step 2: Test Django-MongoDB integration
     print("\n2. Testing Django-MongoDB integration...")
     try:
-        from mongoengine import connect
-        connect('eb_calculator_db', host='localhost', port=27017)
+        from mongodb_connection import connect_mongoengine
+        connect_mongoengine()
         print("✓ Django-MongoDB integration successful")
     except Exception as e:
         print(f"✗ Django-MongoDB integration failed: {e}")
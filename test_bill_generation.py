@@ -16,6 +16,7 @@ django.setup()
 
 from bills.models import User, DailyUsage, BillCalculation, Appliance
 from bills.utils import TamilNaduTariffCalculator, generate_invoice_number
+from usage_aggregation import aggregate_cycle_usage
 
 def test_bill_generation():
     """Test the complete bill generation process"""
@@ -61,11 +62,14 @@ def test_bill_generation():
         date__lte=end_date
     )
     
-    total_units = sum(record.total_units for record in usage_records)
-    print(f"   Found {len(usage_records)} usage records")
+    cycle = aggregate_cycle_usage(usage_records)
+    total_units = cycle['total_units']
+    print(f"   Found {cycle['record_count']} usage records")
     print(f"   Total units in last 60 days: {total_units:.2f} kWh")
+    for name, units in cycle['appliance_units'].items():
+        print(f"     - {name}: {units:.2f} kWh")
     
-    if len(usage_records) == 0:
+    if cycle['record_count'] == 0:
         print("   No usage data found. Adding sample data...")
         # Add some sample usage data
         sample_dates = [
@@ -97,7 +101,7 @@ def test_bill_generation():
             date__gte=start_date,
             date__lte=end_date
         )
-        total_units = sum(record.total_units for record in usage_records)
+        total_units = aggregate_cycle_usage(usage_records)['total_units']
         print(f"   New total units: {total_units:.2f} kWh")
     
     # 5. Test bill generation
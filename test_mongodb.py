@@ -16,8 +16,8 @@ django.setup()
 def test_mongodb_connection():
     """Test MongoDB connection"""
     try:
-        from mongoengine import connect
-        connect('eb_calculator_db', host='localhost', port=27017)
+        from mongodb_connection import connect_mongoengine
+        connect_mongoengine()
         print("✓ MongoDB connection successful")
         return True
     except Exception as e:
@@ -82,7 +82,8 @@ def main():
     
     # Test MongoDB connection
     if not test_mongodb_connection():
-        print("\nPlease ensure MongoDB is running on localhost:27017")
+        from mongodb_connection import server_address
+        print(f"\nPlease ensure MongoDB is running on {server_address()}")
         return
     
     # Test models
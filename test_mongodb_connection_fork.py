@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Test that forked workers do not reuse the parent's MongoDB clients
+Covers the shared pymongo client and mongoengine aliases, whether registered by
+connect_mongoengine() or by plain mongoengine.connect() (as the Django settings do)
+No running MongoDB server is needed; clients connect lazily
+"""
+import os
+import sys
+
+# Add the project directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from mongoengine import Document, StringField, connect
+from mongoengine.connection import get_connection
+
+from mongodb_connection import connect_mongoengine, get_client
+
+FORK_TEST_ALIAS = 'fork_test'
+PLAIN_FORK_TEST_ALIAS = 'fork_test_plain'
+
+
+class ForkTestRecord(Document):
+    name = StringField()
+    meta = {'db_alias': FORK_TEST_ALIAS, 'collection': 'fork_test_records', 'auto_create_index': False}
+
+
+class PlainForkTestRecord(Document):
+    name = StringField()
+    meta = {'db_alias': PLAIN_FORK_TEST_ALIAS, 'collection': 'fork_test_records', 'auto_create_index': False}
+
+
+def run_in_child(check):
+    """Run check() in a forked child and return its boolean result"""
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os._exit(0 if check() else 1)
+        except Exception as e:
+            print(f"   Child error: {e}")
+            os._exit(2)
+    _, status = os.waitpid(pid, 0)
+    return os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+
+
+def test_pymongo_client_after_fork():
+    """The shared pymongo client is rebuilt in the child"""
+    print("🧪 Testing shared pymongo client after fork...")
+    parent_client = get_client()
+    ok = run_in_child(lambda: get_client() is not parent_client)
+    print(f"   {'✅' if ok else '❌'} Child {'built its own' if ok else 'reused the parent'} client")
+    return ok
+
+
+def check_alias_after_fork(alias, doc_cls):
+    """A mongoengine alias and the Documents using it get a new client in the child"""
+    parent_connection = get_connection(alias)
+    parent_collection = doc_cls._get_collection()
+
+    def child_check():
+        child_connection = get_connection(alias)
+        child_collection = doc_cls._get_collection()
+        return (
+            child_connection is not parent_connection
+            and child_collection.database.client is child_connection
+            and child_collection is not parent_collection
+        )
+
+    ok = run_in_child(child_check)
+    print(f"   {'✅' if ok else '❌'} Child {'built its own' if ok else 'reused the parent'} mongoengine client")
+
+    # The parent keeps its own connection
+    parent_ok = get_connection(alias) is parent_connection
+    print(f"   {'✅' if parent_ok else '❌'} Parent connection unchanged")
+    return ok and parent_ok
+
+
+def test_mongoengine_alias_after_fork():
+    """Alias registered through connect_mongoengine()"""
+    print("\n🧪 Testing connect_mongoengine() alias after fork...")
+    connect_mongoengine(alias=FORK_TEST_ALIAS)
+    return check_alias_after_fork(FORK_TEST_ALIAS, ForkTestRecord)
+
+
+def test_plain_mongoengine_alias_after_fork():
+    """Alias registered with plain mongoengine.connect(), like the Django 'default' alias"""
+    print("\n🧪 Testing plain mongoengine.connect() alias after fork...")
+    connect('fork_test_db', alias=PLAIN_FORK_TEST_ALIAS, serverSelectionTimeoutMS=1000)
+    return check_alias_after_fork(PLAIN_FORK_TEST_ALIAS, PlainForkTestRecord)
+
+
+def main():
+    print("🚀 MongoDB Connection Fork-Safety Test")
+    print("=" * 50)
+
+    if not hasattr(os, 'fork'):
+        print("ℹ️  os.fork() is not available on this platform; skipping")
+        return True
+
+    pymongo_test = test_pymongo_client_after_fork()
+    mongoengine_test = test_mongoengine_alias_after_fork()
+    plain_mongoengine_test = test_plain_mongoengine_alias_after_fork()
+
+    print("\n" + "=" * 50)
+    print(f"   Pymongo client: {'✅ PASS' if pymongo_test else '❌ FAIL'}")
+    print(f"   Mongoengine alias: {'✅ PASS' if mongoengine_test else '❌ FAIL'}")
+    print(f"   Plain mongoengine alias: {'✅ PASS' if plain_mongoengine_test else '❌ FAIL'}")
+
+    return pymongo_test and mongoengine_test and plain_mongoengine_test
+
+
+if __name__ == '__main__':
+    success = main()
+    if not success:
+        sys.exit(1)
@@ -106,7 +106,7 @@ def test_bill_calculation_with_mongodb_data():
             return False
         
         # Calculate total units
-        total_units = sum(record.total_units for record in usage_records)
+        total_units = usage_records.sum('total_units')
         print(f"⚡ Total units consumed: {total_units:.2f} kWh")
         
         # Test Tamil Nadu tariff calculation
@@ -173,13 +173,13 @@ def show_mongodb_summary():
             usage_count = DailyUsage.objects.filter(user=user).count()
             if usage_count > 0:
                 latest_usage = DailyUsage.objects.filter(user=user).order_by('-date').first()
-                total_consumption = sum(record.total_units for record in DailyUsage.objects.filter(user=user))
+                total_consumption = DailyUsage.objects.filter(user=user).sum('total_units')
                 print(f"   {user.username}: {usage_count} records, {total_consumption:.2f} total kWh")
                 print(f"     Latest: {latest_usage.date.strftime('%Y-%m-%d')} ({latest_usage.total_units:.2f} kWh)")
         
         # Overall statistics
         total_usage_records = DailyUsage.objects.count()
-        total_consumption = sum(record.total_units for record in DailyUsage.objects.all())
+        total_consumption = DailyUsage.objects.sum('total_units')
         
         print(f"\n📈 Overall Statistics:")
         print(f"   Total usage records: {total_usage_records}")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Test that configured read preferences reach both pymongo and mongoengine clients
+No running MongoDB server is needed; clients connect lazily
+"""
+import os
+import sys
+
+# Add the project directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from mongodb_connection import (
+    ANALYTICAL, MONGODB_ANALYTICS_MAX_STALENESS_S, MONGODB_ANALYTICS_READ_PREFERENCE,
+    MONGODB_READ_PREFERENCE, TRANSACTIONAL, connect_mongoengine, get_client, read_preference
+)
+
+def check(label, actual, expected):
+    ok = actual == expected
+    print(f"   {'✅' if ok else '❌'} {label}: {actual}{'' if ok else f' (expected {expected})'}")
+    return ok
+
+def test_transactional_read_preference():
+    """MONGODB_READ_PREFERENCE applies to pymongo and mongoengine connections"""
+    print("🧪 Testing transactional read preference...")
+    expected = read_preference(MONGODB_READ_PREFERENCE)
+    connection = connect_mongoengine(alias='read_pref_transactional', route=TRANSACTIONAL)
+    return all([
+        check("pymongo client", get_client(TRANSACTIONAL).read_preference, expected),
+        check("mongoengine alias", connection.read_preference, expected),
+    ])
+
+def test_analytical_read_preference():
+    """An 'analytics' alias gets the analytical read preference and staleness limit"""
+    print("\n🧪 Testing analytical read preference...")
+    expected = read_preference(MONGODB_ANALYTICS_READ_PREFERENCE, MONGODB_ANALYTICS_MAX_STALENESS_S)
+    connection = connect_mongoengine(alias='analytics', route=ANALYTICAL)
+    return all([
+        check("pymongo client", get_client(ANALYTICAL).read_preference, expected),
+        check("mongoengine alias", connection.read_preference, expected),
+    ])
+
+def main():
+    print("🚀 MongoDB Read Preference Test")
+    print("=" * 50)
+
+    transactional_test = test_transactional_read_preference()
+    analytical_test = test_analytical_read_preference()
+
+    print("\n" + "=" * 50)
+    print(f"   Transactional route: {'✅ PASS' if transactional_test else '❌ FAIL'}")
+    print(f"   Analytical route: {'✅ PASS' if analytical_test else '❌ FAIL'}")
+
+    return transactional_test and analytical_test
+
+if __name__ == '__main__':
+    success = main()
+    if not success:
+        sys.exit(1)
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+"""
+Server-side aggregation helpers for DailyUsage querysets
+"""
+
+
+def aggregate_cycle_usage(usage_records):
+    """Return record count, total units and per-appliance units in one round trip
+
+    The queryset's filter becomes the $match stage, so only the aggregated
+    numbers come back instead of every DailyUsage document.
+    """
+    result = next(usage_records.aggregate([
+        {'$facet': {
+            'cycle': [
+                {'$group': {
+                    '_id': None,
+                    'record_count': {'$sum': 1},
+                    'total_units': {'$sum': '$total_units'},
+                }}
+            ],
+            'appliances': [
+                {'$unwind': '$appliances'},
+                {'$group': {
+                    '_id': '$appliances.name',
+                    'units': {'$sum': '$appliances.units_consumed'},
+                }},
+                {'$sort': {'_id': 1}},
+            ],
+        }}
+    ]))
+    
+    cycle = result['cycle'][0] if result['cycle'] else {}
+    return {
+        'record_count': cycle.get('record_count', 0),
+        'total_units': cycle.get('total_units', 0.0),
+        'appliance_units': {row['_id']: row['units'] for row in result['appliances']},
+    }
@@ -14,11 +14,11 @@ def check_mongodb_service():
     """Check if MongoDB service is running"""
     print("🔍 Checking MongoDB Service...")
     try:
-        import pymongo
-        client = pymongo.MongoClient('localhost', 27017, serverSelectionTimeoutMS=3000)
-        # Force connection
-        server_info = client.server_info()
-        print(f"✅ MongoDB is running on localhost:27017")
+        from mongodb_connection import check_server, get_client, server_address
+        # Short probe so a stopped server fails fast
+        server_info = check_server(timeout_ms=3000)
+        client = get_client()
+        print(f"✅ MongoDB is running on {server_address()}")
         print(f"   MongoDB version: {server_info.get('version', 'Unknown')}")
         
         # List all databases
@@ -162,8 +162,9 @@ def show_database_contents():
     """Show what's actually in the database"""
     print("\n📊 Database Contents Summary...")
     try:
-        import pymongo
-        client = pymongo.MongoClient('localhost', 27017)
+        # Read-your-writes check, so stay on the primary
+        from mongodb_connection import get_client
+        client = get_client()
         
         # Check both possible database names
         db_names = ['eb_calculator_website_db', 'eb_calculator_db']
@@ -220,7 +221,14 @@ def main():
         print("\n❌ Django integration failed.")
         return False
     
-    # Step 5: Create test data
+    # Step 5: Check required indexes (read-only)
+    print("\n🗂️ Checking Required Indexes...")
+    from init_mongodb_database import verify_required_indexes
+    if not verify_required_indexes():
+        print("\n❌ Required indexes are missing. Run: python init_mongodb_database.py")
+        return False
+    
+    # Step 6: Create test data
     test_ok, test_user = create_test_user_and_data()
     if not test_ok:
         print("\n❌ Test data creation failed.")
@@ -228,7 +236,8 @@ def main():
     
     print("\n" + "=" * 80)
     print("✅ ALL CHECKS PASSED!")
-    print(f"🎯 Your website is connected to: {db_name} on localhost:27017")
+    from mongodb_connection import server_address
+    print(f"🎯 Your website is connected to: {db_name} on {server_address()}")
     print(f"👤 Test user created: website_test_user / test123")
     print("\n🌐 Next steps:")
     print("1. Kill any running Django servers")